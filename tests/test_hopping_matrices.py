@@ -0,0 +1,73 @@
+"""Test the construction of the hopping matrices."""
+import pytest
+import tmdybinding as tmdy
+import numpy as np
+import pickle
+from copy import copy, deepcopy
+
+
+def test_shared_instance():
+    """Equal parameter sets share one instance with read-only matrices."""
+    params = tmdy.all["MoS2"]
+    t_m = tmdy.TmdMatrices(params)
+    assert tmdy.TmdMatrices(deepcopy(params)) is t_m
+    assert not t_m.t_2_m.flags.writeable
+    with pytest.raises(ValueError):
+        t_m.e_me[0, 0] = 0.
+
+
+def test_changed_params():
+    """Changing the parameters gives new matrices, while the old instance is not affected."""
+    params = deepcopy(tmdy.liu2["MoS2"])
+    t_m = tmdy.TmdMatrices(params)
+    e_me = t_m.e_me.copy()
+    params["eps_0_m_e"] = params["eps_0_m_e"] + 1.
+    assert np.allclose(tmdy.TmdMatrices(params).e_me - e_me, np.diag([1., 0., 0.]))
+    assert np.allclose(t_m.e_me, e_me)
+
+
+def test_evicted_instance():
+    """Only the `max_instances` most recently used parameter sets keep their instance."""
+    params = deepcopy(tmdy.liu2["MoS2"])
+    t_m = tmdy.TmdMatrices(params)
+    for i in range(tmdy.TmdMatrices.max_instances):
+        params["eps_0_m_e"] = params["eps_0_m_e"] + 1.
+        tmdy.TmdMatrices(params)
+    assert tmdy.TmdMatrices(tmdy.liu2["MoS2"]) is not t_m
+
+
+def test_dtype():
+    """The matrices follow the requested data type."""
+    t_m = tmdy.TmdMatrices(tmdy.all["MoS2"], dtype=np.float32)
+    assert t_m.t_1_me.dtype == np.float32
+    assert t_m.m_blocks.dtype == np.float32
+    assert np.allclose(t_m.t_6_x, tmdy.TmdMatrices(tmdy.all["MoS2"]).t_6_x, atol=1e-6)
+
+
+def test_block_diag():
+    """The block diagonal matrix for two-dimensional, stacked and complex matrices."""
+    a, b = np.arange(4.).reshape(2, 2), np.array([[5.]])
+    assert tmdy.block_diag(a) is a
+    assert np.array_equal(tmdy.block_diag(a, b), [[0., 1., 0.], [2., 3., 0.], [0., 0., 5.]])
+    stacked = tmdy.block_diag(np.stack((a, 2 * a)), np.stack((b, 2 * b)))
+    assert stacked.shape == (2, 3, 3)
+    assert np.array_equal(stacked[1], tmdy.block_diag(2 * a, 2 * b))
+    c = tmdy.block_diag(a, 1j * b)
+    assert c.dtype == complex and c[2, 2] == 5j and c[0, 2] == 0
+
+
+def test_copy_and_pickle():
+    """Copying or unpickling gives the shared instance for the same parameters."""
+    t_m = tmdy.TmdMatrices(tmdy.all["MoS2"], dtype=np.float32)
+    assert copy(t_m) is t_m
+    assert deepcopy(t_m) is t_m
+    assert pickle.loads(pickle.dumps(t_m)) is t_m
+
+
+def test_combined_matrices():
+    """The combined matrices are built per pair and agree with the stacked blocks."""
+    t_m = tmdy.TmdMatrices(tmdy.cappelluti["MoS2"], dtype=np.float32)
+    assert np.array_equal(t_m.t_2_m, tmdy.block_diag(t_m.t_2_me, t_m.t_2_mo))
+    assert "m_blocks" not in vars(t_m)
+    assert np.array_equal(t_m.t_2_m, t_m.m_blocks[1])
+    assert np.array_equal(t_m.t_1_m, t_m.mx_blocks[0])
@@ -82,3 +82,13 @@ def test_energies(energy, baseline):
     """Test the most basic lattice from Liu2."""
     expected = baseline(energy)
     assert pytest.fuzzy_equal(energy, expected)
+
+
+def test_separate_orbitals():
+    """Every lattice has its own orbitals, changing them does not change the other lattices."""
+    lattice = tmdy.TmdNN123MeoXeo()
+    lattice.orbital.clockwise = True
+    lattice.orbital.l_number["M"][0] = 1
+    other = tmdy.TmdNN123456MeoXeo()
+    assert not other.orbital.clockwise
+    assert other.orbital.l_number["M"][0] == 0
@@ -7,6 +7,28 @@ from .parameters import ParametersList
 from abc import ABC, abstractmethod
 
 
+def block_diag(*matrices: np.ndarray) -> np.ndarray:
+    """Make a block diagonal matrix from the given matrices, a single matrix is returned unchanged.
+
+    The blocks are taken from the last two axes, any leading axes must be the same for all the matrices.
+
+    Parameters:
+        matrices (np.ndarray): The matrices to put on the diagonal."""
+    if len(matrices) == 1:
+        return matrices[0]
+    matrices = [np.asarray(matrix) for matrix in matrices]
+    shapes = [np.shape(matrix) for matrix in matrices]
+    assert all(shape[:-2] == shapes[0][:-2] for shape in shapes), \
+        "The matrices don't have the right sizes in the additional dimensions"
+    out = np.zeros((*shapes[0][:-2], sum(shape[-2] for shape in shapes), sum(shape[-1] for shape in shapes)),
+                   dtype=np.result_type(*matrices))
+    row, col = 0, 0
+    for matrix, shape in zip(matrices, shapes):
+        out[..., row:row + shape[-2], col:col + shape[-1]] = matrix
+        row, col = row + shape[-2], col + shape[-1]
+    return out
+
+
 class VariableStorage:
     """
     Class for saving the matrices and variables in the AbstractLattice-class.
@@ -804,25 +826,10 @@ class AbstractLattice(ABC):
     def _reorder(matrix: np.ndarray, keys: Tuple[List[int], List[int]]) -> np.ndarray:
         return np.array([[matrix[xi, yi] for yi in keys[1]] for xi in keys[0]])
 
-    def block_diag(self, *matrices) -> np.ndarray:
+    @staticmethod
+    def block_diag(*matrices) -> np.ndarray:
         """Make a block diagonal matrix from the given matrices."""
-        if len(matrices) == 1:
-            return matrices[0]
-        else:
-            matrix0 = matrices[0]
-            matrix1 = self.block_diag(*matrices[1:])
-            shape_0 = np.shape(matrix0)
-            shape_1 = np.shape(matrix1)
-            z_1 = [shape_0[-2], shape_1[-1]]
-            z_2 = [shape_1[-2], shape_0[-1]]
-            nd = len(shape_0)
-            assert nd == len(shape_1), "The matrices don't have the right sizes in the additional dimensions"
-            if nd > 2:
-                for sh in shape_1[:-2]:
-                    z_1.insert(0, sh)
-                    z_2.insert(0, sh)
-            return np.concatenate((np.concatenate((matrix0, np.zeros(z_1)), axis=nd - 1),
-                                   np.concatenate((np.zeros(z_2), matrix1), axis=nd - 1)), axis=nd - 2)
+        return block_diag(*matrices)
 
     def _make_onsite(self, matrix, name, lamb):
         def ham_sz(sz):
@@ -867,11 +874,11 @@ class AbstractLattice(ABC):
             for f_i, nf_i in enumerate(fnl):
                 for t_j, nt_j in enumerate(tnl):
                     h_names = [self._make_name(h_name, n_i, nfi, ntj) for n_i, nfi, ntj in zip(n_n_n, nf_i, nt_j)]
-                    lat.register_hopping_energies(dict([(h_n_i, h.conj().T[f_i, t_j]) for h_n_i, h in zip(h_names, hn)]))
+                    lat.register_hopping_energies({h_n_i: h.conj().T[f_i, t_j] for h_n_i, h in zip(h_names, hn)})
                     lat.add_hoppings(*[(co, nfi, ntj, h_n_i) for co, h_n_i, nfi, ntj in zip(cos, h_names, nf_i, nt_j)])
         else:
             h_names = [self._make_name(h_name, n_i, nfi, ntj) for n_i, nfi, ntj in zip(n_n_n, fnl, tnl)]
-            lat.register_hopping_energies(dict([(h_n_i, h.conj().T) for h_n_i, h in zip(h_names, hn)]))
+            lat.register_hopping_energies({h_n_i: h.conj().T for h_n_i, h in zip(h_names, hn)})
             lat.add_hoppings(*[(co, nfi, ntj, h_n_i) for co, h_n_i, nfi, ntj in zip(cos, h_names, fnl, tnl)])
         return lat
 
@@ -1,16 +1,98 @@
 """ The matrices for TMD hoppings"""
 import numpy as np
+from numpy.typing import DTypeLike
+from collections import OrderedDict
+from copy import deepcopy
+from functools import cached_property
+from threading import Lock
+from typing import Sequence
 from tmdybinding.parameters.symmetry_group import ParametersList
+from tmdybinding.tmd_abstract_lattice import block_diag
+
+
+def _read_only(matrix: np.ndarray) -> np.ndarray:
+    """Mark the matrix as read-only, as the matrices are shared between the users of a `TmdMatrices` instance."""
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _hopping_matrix(builder: str, keys: Sequence[str], doc: str) -> cached_property:
+    """Make a cached property that builds a hopping matrix from the parameters.
+
+    Parameters:
+        builder (str): The name of the static method of `TmdMatrices` that builds the matrix.
+        keys (Sequence[str]): The names of the parameters, given in the order of the arguments of `builder`.
+        doc (str): The docstring for the property."""
+    keys = tuple(keys)
+
+    def matrix(self):
+        values = [self._params[key] for key in keys]
+        return _read_only(np.asarray(getattr(self, builder)(*values), dtype=self.dtype))
+
+    matrix.__doc__ = doc
+    return cached_property(matrix)
+
+
+def _combined_matrix(even: str, odd: str, doc: str) -> cached_property:
+    """Make a cached property that combines the even and odd part of a hopping matrix.
+
+    Parameters:
+        even (str): The name of the property of `TmdMatrices` with the even part.
+        odd (str): The name of the property of `TmdMatrices` with the odd part.
+        doc (str): The docstring for the property."""
+    def matrix(self):
+        return _read_only(block_diag(getattr(self, even), getattr(self, odd)))
+
+    matrix.__doc__ = doc
+    return cached_property(matrix)
 
 
 class TmdMatrices:
-    """Construct the TMD hopping matrices"""
-    def __init__(self, params: ParametersList):
+    """Construct the TMD hopping matrices
+
+    Instances are shared: constructing a `TmdMatrices` for a parameter set with the same values as one of the
+    `max_instances` most recently used parameter sets returns that instance, so its (read-only) matrices are only
+    built once."""
+    max_instances: int = 32
+    _instances: "OrderedDict[tuple, TmdMatrices]" = OrderedDict()
+    _lock = Lock()
+
+    def __new__(cls, params: ParametersList, dtype: DTypeLike = np.float64):
+        dtype = np.dtype(dtype)
+        key = (cls, dtype, type(params), tuple(params.get_dict().items()))
+        with cls._lock:
+            instance = cls._instances.pop(key, None)
+            if instance is None:
+                instance = super().__new__(cls)
+                # keep a private copy, later changes to `params` would otherwise silently change the cached matrices
+                instance._params = deepcopy(params)
+                instance.dtype = dtype
+            cls._instances[key] = instance
+            while len(cls._instances) > cls.max_instances:
+                cls._instances.popitem(last=False)
+        return instance
+
+    def __init__(self, params: ParametersList, dtype: DTypeLike = np.float64):
         """Initialize the TMD hopping matrices
 
         Parameters:
-            params (ParametersList): The parameters for the TMD lattice."""
-        self.params = params
+            params (ParametersList): The parameters for the TMD lattice.
+            dtype (DTypeLike): The data type of the matrices. `np.float32` halves the memory of the matrices, which is
+                precise enough for qualitative band structures; the default is `np.float64`."""
+
+    def __reduce__(self):
+        # copies and unpickled instances go through `__new__` again, so they are the shared instance as well
+        return type(self), (self._params, self.dtype)
+
+    @property
+    def params(self) -> ParametersList:
+        """The (copied) parameters of the matrices, do not change them: the instance is shared for these values."""
+        return self._params
+
+    @staticmethod
+    def _diag(*u):
+        """The diagonal matrices for the onsite energies and the fifth-nearest neighbours from the odd metal orbitals"""
+        return np.diag(u)
 
     @staticmethod
     def _t_n_e(u_0, u_1, u_2, u_3, u_4):
@@ -37,121 +119,110 @@ class TmdMatrices:
         """The hopping matrices for the second-, fifth- and sixth-nearest neighbours from the odd metal orbitals"""
         return np.array([[u_0, u_1], [-u_1, u_2]])
 
+    @staticmethod
+    def _t_5_me(u_0, u_1, u_3, u_5, u_6):
+        """The hopping matrices for the fifth-nearest neighbours from the even metal orbitals"""
+        return np.array([[u_0, -u_1, 0], [-u_6, u_3, 0], [0, 0, u_5]])
+
     @staticmethod
     def _t_5_xr(u_0, u_2, u_3, u_5, u_6):
         """The hopping matrices for the fifth-nearest neighbours from the chalcogen orbitals"""
         return np.array([[u_3, 0, 0], [0, u_0, u_2], [0, u_6, u_5]])
 
-    @property
-    def e_xe(self):
-        """The hopping matrix for the even chalcogen orbitals"""
-        return np.diag((self.params["eps_0_x_e"], self.params["eps_0_x_e"], self.params["eps_1_x_e"]))
-
-    @property
-    def e_xo(self):
-        """The hopping matrix for the odd chalcogen orbitals"""
-        return np.diag((self.params["eps_0_x_o"], self.params["eps_0_x_o"], self.params["eps_1_x_o"]))
-
-    @property
-    def e_me(self):
-        """The hopping matrix for the even metal orbitals"""
-        return np.diag((self.params["eps_0_m_e"], self.params["eps_1_m_e"], self.params["eps_1_m_e"]))
-
-    @property
-    def e_mo(self):
-        """The hopping matrix for the odd metal orbitals"""
-        return np.diag((self.params["eps_0_m_o"], self.params["eps_0_m_o"]))
-
-    @property
-    def t_1_me(self):
-        """The first-nearest neighbour hopping matrix from the even metal orbitals"""
-        return self._t_n_e(*[self.params[f"u_1_{i}_m_e"] for i in range(5)])
-
-    @property
-    def t_1_mo(self):
-        """The first-nearest neighbour hopping matrix from the odd metal orbitals"""
-        return self._t_n_o(*[self.params[f"u_1_{i}_m_o"] for i in range(3)])
-
-    @property
-    def t_2_me(self):
-        """The second-nearest neighbour hopping matrix from the even metal orbitals"""
-        return self._t_m_me(*[self.params[f"u_2_{i}_m_e"] for i in range(6)])
-
-    @property
-    def t_2_mo(self):
-        """The second-nearest neighbour hopping matrix from the odd metal orbitals"""
-        return self._t_m_mo(*[self.params[f"u_2_{i}_m_o"] for i in range(3)])
-
-    @property
-    def t_2_xe(self):
-        """The second-nearest neighbour hopping matrix from the even chalcogen orbitals"""
-        return self._t_m_xr(*[self.params[f"u_2_{i}_x_e"] for i in range(6)])
-
-    @property
-    def t_2_xo(self):
-        """The second-nearest neighbour hopping matrix from the odd chalcogen orbitals"""
-        return self._t_m_xr(*[self.params[f"u_2_{i}_x_o"] for i in range(6)])
-
-    @property
-    def t_3_me(self):
-        """The third-nearest neighbour hopping matrix from the even metal orbitals"""
-        return self._t_n_e(*[self.params[f"u_3_{i}_m_e"] for i in range(5)])
-
-    @property
-    def t_3_mo(self):
-        """The third-nearest neighbour hopping matrix from the odd metal orbitals"""
-        return self._t_n_o(*[self.params[f"u_3_{i}_m_o"] for i in range(3)])
-
-    @property
-    def t_4_me(self):
-        """The fourth-nearest neighbour hopping matrix from the even metal orbitals"""
-        return self._t_n_e(*[self.params[f"u_4_{i}_m_e"] for i in range(5)])
-
-    @property
-    def t_4_mo(self):
-        """The fourth-nearest neighbour hopping matrix from the odd metal orbitals"""
-        return self._t_n_o(*[self.params[f"u_4_{i}_m_o"] for i in range(3)])
-
-    @property
-    def t_5_me(self):
-        """The fifth-nearest neighbour hopping matrix from the even metal orbitals"""
-        return np.array([
-            [self.params["u_5_0_m_e"],  -self.params["u_5_1_m_e"],  0.0],
-            [-self.params["u_5_6_m_e"], self.params["u_5_3_m_e"],   0.0],
-            [0.0,                       0.0,                        self.params["u_5_5_m_e"]]
-        ])
-
-    @property
-    def t_5_mo(self):
-        """The fifth-nearest neighbour hopping matrix from the odd metal orbitals"""
-        return np.diag((self.params["u_5_2_m_o"], self.params["u_5_0_m_o"]))
-
-    @property
-    def t_5_xe(self):
-        """The fifth-nearest neighbour hopping matrix from the even chalcogen orbitals"""
-        return self._t_5_xr(*[self.params[f"u_5_{i}_x_e"] for i in ("0", "2", "3", "5", "6")])
-
-    @property
-    def t_5_xo(self):
-        """The fifth-nearest neighbour hopping matrix from the odd chalcogen orbitals"""
-        return self._t_5_xr(*[self.params[f"u_5_{i}_x_o"] for i in ("0", "2", "3", "5", "6")])
-
-    @property
-    def t_6_me(self):
-        """The sixth-nearest neighbour hopping matrix from the even metal orbitals"""
-        return self._t_m_me(*[self.params[f"u_6_{i}_m_e"] for i in range(6)])
-
-    @property
-    def t_6_mo(self):
-        """The sixth-nearest neighbour hopping matrix from the odd metal orbitals"""
-        return self._t_m_mo(*[self.params[f"u_6_{i}_m_o"] for i in range(3)])
-
-    @property
-    def t_6_xe(self):
-        """The sixth-nearest neighbour hopping matrix from the even chalcogen orbitals"""
-        return self._t_m_xr(*[self.params[f"u_6_{i}_x_e"] for i in range(6)])
-
-    @property
-    def t_6_xo(self):
-        """The sixth-nearest neighbour hopping matrix from the odd chalcogen orbitals"""
-        return self._t_m_xr(*[self.params[f"u_6_{i}_x_o"] for i in range(6)])
+    e_xe = _hopping_matrix("_diag", ("eps_0_x_e", "eps_0_x_e", "eps_1_x_e"),
+                           "The hopping matrix for the even chalcogen orbitals")
+    e_xo = _hopping_matrix("_diag", ("eps_0_x_o", "eps_0_x_o", "eps_1_x_o"),
+                           "The hopping matrix for the odd chalcogen orbitals")
+    e_me = _hopping_matrix("_diag", ("eps_0_m_e", "eps_1_m_e", "eps_1_m_e"),
+                           "The hopping matrix for the even metal orbitals")
+    e_mo = _hopping_matrix("_diag", ("eps_0_m_o", "eps_0_m_o"),
+                           "The hopping matrix for the odd metal orbitals")
+    t_1_me = _hopping_matrix("_t_n_e", [f"u_1_{i}_m_e" for i in range(5)],
+                             "The first-nearest neighbour hopping matrix from the even metal orbitals")
+    t_1_mo = _hopping_matrix("_t_n_o", [f"u_1_{i}_m_o" for i in range(3)],
+                             "The first-nearest neighbour hopping matrix from the odd metal orbitals")
+    t_2_me = _hopping_matrix("_t_m_me", [f"u_2_{i}_m_e" for i in range(6)],
+                             "The second-nearest neighbour hopping matrix from the even metal orbitals")
+    t_2_mo = _hopping_matrix("_t_m_mo", [f"u_2_{i}_m_o" for i in range(3)],
+                             "The second-nearest neighbour hopping matrix from the odd metal orbitals")
+    t_2_xe = _hopping_matrix("_t_m_xr", [f"u_2_{i}_x_e" for i in range(6)],
+                             "The second-nearest neighbour hopping matrix from the even chalcogen orbitals")
+    t_2_xo = _hopping_matrix("_t_m_xr", [f"u_2_{i}_x_o" for i in range(6)],
+                             "The second-nearest neighbour hopping matrix from the odd chalcogen orbitals")
+    t_3_me = _hopping_matrix("_t_n_e", [f"u_3_{i}_m_e" for i in range(5)],
+                             "The third-nearest neighbour hopping matrix from the even metal orbitals")
+    t_3_mo = _hopping_matrix("_t_n_o", [f"u_3_{i}_m_o" for i in range(3)],
+                             "The third-nearest neighbour hopping matrix from the odd metal orbitals")
+    t_4_me = _hopping_matrix("_t_n_e", [f"u_4_{i}_m_e" for i in range(5)],
+                             "The fourth-nearest neighbour hopping matrix from the even metal orbitals")
+    t_4_mo = _hopping_matrix("_t_n_o", [f"u_4_{i}_m_o" for i in range(3)],
+                             "The fourth-nearest neighbour hopping matrix from the odd metal orbitals")
+    t_5_me = _hopping_matrix("_t_5_me", [f"u_5_{i}_m_e" for i in ("0", "1", "3", "5", "6")],
+                             "The fifth-nearest neighbour hopping matrix from the even metal orbitals")
+    t_5_mo = _hopping_matrix("_diag", ("u_5_2_m_o", "u_5_0_m_o"),
+                             "The fifth-nearest neighbour hopping matrix from the odd metal orbitals")
+    t_5_xe = _hopping_matrix("_t_5_xr", [f"u_5_{i}_x_e" for i in ("0", "2", "3", "5", "6")],
+                             "The fifth-nearest neighbour hopping matrix from the even chalcogen orbitals")
+    t_5_xo = _hopping_matrix("_t_5_xr", [f"u_5_{i}_x_o" for i in ("0", "2", "3", "5", "6")],
+                             "The fifth-nearest neighbour hopping matrix from the odd chalcogen orbitals")
+    t_6_me = _hopping_matrix("_t_m_me", [f"u_6_{i}_m_e" for i in range(6)],
+                             "The sixth-nearest neighbour hopping matrix from the even metal orbitals")
+    t_6_mo = _hopping_matrix("_t_m_mo", [f"u_6_{i}_m_o" for i in range(3)],
+                             "The sixth-nearest neighbour hopping matrix from the odd metal orbitals")
+    t_6_xe = _hopping_matrix("_t_m_xr", [f"u_6_{i}_x_e" for i in range(6)],
+                             "The sixth-nearest neighbour hopping matrix from the even chalcogen orbitals")
+    t_6_xo = _hopping_matrix("_t_m_xr", [f"u_6_{i}_x_o" for i in range(6)],
+                             "The sixth-nearest neighbour hopping matrix from the odd chalcogen orbitals")
+
+    @cached_property
+    def m_blocks(self) -> np.ndarray:
+        """The onsite, second-, fifth- and sixth-nearest neighbour hopping matrices from the metal orbitals,
+        the even and odd part combined, stacked along the first axis"""
+        return _read_only(block_diag(np.stack((self.e_me, self.t_2_me, self.t_5_me, self.t_6_me)),
+                                     np.stack((self.e_mo, self.t_2_mo, self.t_5_mo, self.t_6_mo))))
+
+    @cached_property
+    def x_blocks(self) -> np.ndarray:
+        """The onsite, second-, fifth- and sixth-nearest neighbour hopping matrices from the chalcogen orbitals,
+        the even and odd part combined, stacked along the first axis"""
+        return _read_only(block_diag(np.stack((self.e_xe, self.t_2_xe, self.t_5_xe, self.t_6_xe)),
+                                     np.stack((self.e_xo, self.t_2_xo, self.t_5_xo, self.t_6_xo))))
+
+    @cached_property
+    def mx_blocks(self) -> np.ndarray:
+        """The first-, third- and fourth-nearest neighbour hopping matrices from the metal to the chalcogen orbitals,
+        the even and odd part combined, stacked along the first axis"""
+        return _read_only(block_diag(np.stack((self.t_1_me, self.t_3_me, self.t_4_me)),
+                                     np.stack((self.t_1_mo, self.t_3_mo, self.t_4_mo))))
+
+    e_m = _combined_matrix("e_me", "e_mo",
+                           "The hopping matrix for the metal orbitals, the even and odd part combined")
+    e_x = _combined_matrix("e_xe", "e_xo",
+                           "The hopping matrix for the chalcogen orbitals, the even and odd part combined")
+    t_1_m = _combined_matrix("t_1_me", "t_1_mo",
+                             "The first-nearest neighbour hopping matrix from the metal orbitals, "
+                             "the even and odd part combined")
+    t_2_m = _combined_matrix("t_2_me", "t_2_mo",
+                             "The second-nearest neighbour hopping matrix from the metal orbitals, "
+                             "the even and odd part combined")
+    t_2_x = _combined_matrix("t_2_xe", "t_2_xo",
+                             "The second-nearest neighbour hopping matrix from the chalcogen orbitals, "
+                             "the even and odd part combined")
+    t_3_m = _combined_matrix("t_3_me", "t_3_mo",
+                             "The third-nearest neighbour hopping matrix from the metal orbitals, "
+                             "the even and odd part combined")
+    t_4_m = _combined_matrix("t_4_me", "t_4_mo",
+                             "The fourth-nearest neighbour hopping matrix from the metal orbitals, "
+                             "the even and odd part combined")
+    t_5_m = _combined_matrix("t_5_me", "t_5_mo",
+                             "The fifth-nearest neighbour hopping matrix from the metal orbitals, "
+                             "the even and odd part combined")
+    t_5_x = _combined_matrix("t_5_xe", "t_5_xo",
+                             "The fifth-nearest neighbour hopping matrix from the chalcogen orbitals, "
+                             "the even and odd part combined")
+    t_6_m = _combined_matrix("t_6_me", "t_6_mo",
+                             "The sixth-nearest neighbour hopping matrix from the metal orbitals, "
+                             "the even and odd part combined")
+    t_6_x = _combined_matrix("t_6_xe", "t_6_xo",
+                             "The sixth-nearest neighbour hopping matrix from the chalcogen orbitals, "
+                             "the even and odd part combined")
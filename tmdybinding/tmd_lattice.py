@@ -14,15 +14,16 @@ class TmdNN2Me(AbstractLattice):
         )
         super().__init__(orbital=orbital, params=liu2["MoS2"], lattice_name="3 bands 2NN model",
                          n_v=0, n_b=3)
-        [setattr(self, var, kwargs[var]) for var in [*kwargs]]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def _generate_matrices(self):
-        t_m = TmdMatrices(self.params)
-        h_0_m = t_m.e_me
-        h_2_m = t_m.t_2_me
-        keys = ["h_0_m", "h_2_m", "a", "lamb_m"]
-        values = [h_0_m, h_2_m, self.params["a"], self.params["lamb_m"]]
-        self.lattice_params.set_params(dict([(key, value) for key, value in zip(keys, values)]))
+        params = self.params
+        t_m = TmdMatrices(params)
+        self.lattice_params.set_params({
+            "h_0_m": t_m.e_me, "h_2_m": t_m.t_2_me,
+            "a": params["a"], "lamb_m": params["lamb_m"]
+        })
 
 
 class TmdNN12MeXe(AbstractLattice):
@@ -35,18 +36,16 @@ class TmdNN12MeXe(AbstractLattice):
         )
         super().__init__(orbital=orbital, params=jorissen["MoS2"], lattice_name="6 bands 2NN model",
                          n_v=3, n_b=6)
-        [setattr(self, var, kwargs[var]) for var in [*kwargs]]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def _generate_matrices(self):
-        t_m = TmdMatrices(self.params)
-        h_0_m = t_m.e_me
-        h_0_x = t_m.e_xe
-        h_1_m = t_m.t_1_me
-        h_2_m = t_m.t_2_me
-        h_2_x = t_m.t_2_xe
-        keys = ["h_0_m", "h_0_c", "h_1_m", "h_2_m", "h_2_c", "a", "lamb_m", "lamb_c"]
-        values = [h_0_m, h_0_x, h_1_m, h_2_m, h_2_x, self.params["a"], self.params["lamb_m"], self.params["lamb_x"]]
-        self.lattice_params.set_params(dict([(key, value) for key, value in zip(keys, values)]))
+        params = self.params
+        t_m = TmdMatrices(params)
+        self.lattice_params.set_params({
+            "h_0_m": t_m.e_me, "h_0_c": t_m.e_xe, "h_1_m": t_m.t_1_me, "h_2_m": t_m.t_2_me, "h_2_c": t_m.t_2_xe,
+            "a": params["a"], "lamb_m": params["lamb_m"], "lamb_c": params["lamb_x"]
+        })
 
 
 class TmdNN12MeoXeo(AbstractLattice):
@@ -59,17 +58,15 @@ class TmdNN12MeoXeo(AbstractLattice):
         )
         super().__init__(orbital=orbital, params=cappelluti["MoS2"], lattice_name="11 bands 2NN model",
                          n_v=6, n_b=11)
-        [setattr(self, var, kwargs[var]) for var in [*kwargs]]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
     def _generate_matrices(self):
-        t_m = TmdMatrices(self.params)
-        h_0_m = self.block_diag(t_m.e_me, t_m.e_mo)
-        h_0_x = self.block_diag(t_m.e_xe, t_m.e_xo)
-        h_1_m = self.block_diag(t_m.t_1_me, t_m.t_1_mo)
-        h_2_m = self.block_diag(t_m.t_2_me, t_m.t_2_mo)
-        h_2_x = self.block_diag(t_m.t_2_xe, t_m.t_2_xo)
-        keys = ["h_0_m", "h_0_c", "h_1_m", "h_2_m", "h_2_c", "a", "lamb_m", "lamb_c"]
-        values = [h_0_m, h_0_x, h_1_m, h_2_m, h_2_x, self.params["a"], self.params["lamb_m"], self.params["lamb_x"]]
-        self.lattice_params.set_params(dict([(key, value) for key, value in zip(keys, values)]))
+        params = self.params
+        t_m = TmdMatrices(params)
+        self.lattice_params.set_params({
+            "h_0_m": t_m.e_m, "h_0_c": t_m.e_x, "h_1_m": t_m.t_1_m, "h_2_m": t_m.t_2_m, "h_2_c": t_m.t_2_x,
+            "a": params["a"], "lamb_m": params["lamb_m"], "lamb_c": params["lamb_x"]
+        })
 
 
 class TmdNN123MeoXeo(AbstractLattice):
@@ -82,21 +79,17 @@ class TmdNN123MeoXeo(AbstractLattice):
         )
         super().__init__(orbital=orbital, params=fang["MoS2"], lattice_name="11 bands 3NN model",
                          n_v=6, n_b=11)
-        [setattr(self, var, kwargs[var]) for var in [*kwargs]]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def _generate_matrices(self):
-        t_m = TmdMatrices(self.params)
-        h_0_m = self.block_diag(t_m.e_me, t_m.e_mo)
-        h_0_x = self.block_diag(t_m.e_xe, t_m.e_xo)
-        h_1_m = self.block_diag(t_m.t_1_me, t_m.t_1_mo)
-        h_2_m = self.block_diag(t_m.t_2_me, t_m.t_2_mo)
-        h_2_x = self.block_diag(t_m.t_2_xe, t_m.t_2_xo)
-        h_3_m = self.block_diag(t_m.t_3_me, t_m.t_1_mo * 0)
-        keys = ["h_0_m", "h_0_c", "h_1_m", "h_2_m", "h_2_c", "h_3_m",
-                "a", "lamb_m", "lamb_c"]
-        values = [h_0_m, h_0_x, h_1_m, h_2_m, h_2_x, h_3_m,
-                  self.params["a"], self.params["lamb_m"], self.params["lamb_x"]]
-        self.lattice_params.set_params(dict([(key, value) for key, value in zip(keys, values)]))
+        params = self.params
+        t_m = TmdMatrices(params)
+        self.lattice_params.set_params({
+            "h_0_m": t_m.e_m, "h_0_c": t_m.e_x, "h_1_m": t_m.t_1_m, "h_2_m": t_m.t_2_m, "h_2_c": t_m.t_2_x,
+            "h_3_m": self.block_diag(t_m.t_3_me, t_m.t_1_mo * 0),
+            "a": params["a"], "lamb_m": params["lamb_m"], "lamb_c": params["lamb_x"]
+        })
 
 
 class TmdNN125MeoXeo(AbstractLattice):
@@ -109,22 +102,17 @@ class TmdNN125MeoXeo(AbstractLattice):
         )
         super().__init__(orbital=orbital, params=dias["MoS2"], lattice_name="11 bands 5NN model",
                          n_v=6, n_b=11)
-        [setattr(self, var, kwargs[var]) for var in [*kwargs]]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def _generate_matrices(self):
-        t_m = TmdMatrices(self.params)
-        h_0_m = self.block_diag(t_m.e_me, t_m.e_mo)
-        h_0_x = self.block_diag(t_m.e_xe, t_m.e_xo)
-        h_1_m = self.block_diag(t_m.t_1_me, t_m.t_1_mo)
-        h_2_m = self.block_diag(t_m.t_2_me, t_m.t_2_mo)
-        h_2_x = self.block_diag(t_m.t_2_xe, t_m.t_2_xo)
-        h_5_m = self.block_diag(t_m.t_5_me, t_m.t_5_mo)
-        h_5_x = self.block_diag(t_m.t_5_xe, t_m.t_5_xo)
-        keys = ["h_0_m", "h_0_c", "h_1_m", "h_2_m", "h_2_c", "h_5_m", "h_5_c",
-                "a", "lamb_m", "lamb_c"]
-        values = [h_0_m, h_0_x, h_1_m, h_2_m, h_2_x, h_5_m, h_5_x,
-                  self.params["a"], self.params["lamb_m"], self.params["lamb_x"]]
-        self.lattice_params.set_params(dict([(key, value) for key, value in zip(keys, values)]))
+        params = self.params
+        t_m = TmdMatrices(params)
+        self.lattice_params.set_params({
+            "h_0_m": t_m.e_m, "h_0_c": t_m.e_x, "h_1_m": t_m.t_1_m, "h_2_m": t_m.t_2_m, "h_2_c": t_m.t_2_x,
+            "h_5_m": t_m.t_5_m, "h_5_c": t_m.t_5_x,
+            "a": params["a"], "lamb_m": params["lamb_m"], "lamb_c": params["lamb_x"]
+        })
 
 
 class TmdNN256Me(AbstractLattice):
@@ -138,16 +126,15 @@ class TmdNN256Me(AbstractLattice):
         )
         super().__init__(orbital=orbital, params=liu6["MoS2"], lattice_name="3 bands 6NN model",
                          n_v=0, n_b=3)
-        [setattr(self, var, kwargs[var]) for var in [*kwargs]]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
     def _generate_matrices(self):
-        t_m = TmdMatrices(self.params)
-        h_0_m = t_m.e_me
-        h_2_m = t_m.t_2_me
-        h_5_m = t_m.t_5_me
-        h_6_m = t_m.t_6_me
-        keys = ["h_0_m", "h_2_m", "h_5_m", "h_6_m", "a", "lamb_m"]
-        values = [h_0_m, h_2_m, h_5_m, h_6_m, self.params["a"], self.params["lamb_m"]]
-        self.lattice_params.set_params(dict([(key, value) for key, value in zip(keys, values)]))
+        params = self.params
+        t_m = TmdMatrices(params)
+        self.lattice_params.set_params({
+            "h_0_m": t_m.e_me, "h_2_m": t_m.t_2_me, "h_5_m": t_m.t_5_me, "h_6_m": t_m.t_6_me,
+            "a": params["a"], "lamb_m": params["lamb_m"]
+        })
 
 
 class TmdNN256Meo(AbstractLattice):
@@ -160,17 +147,17 @@ class TmdNN256Meo(AbstractLattice):
         )
         super().__init__(orbital=orbital, params=wu["MoS2"], lattice_name="5 bands 6NN model",
                          n_v=0, n_b=5)
-        [setattr(self, var, kwargs[var]) for var in [*kwargs]]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def _generate_matrices(self):
-        t_m = TmdMatrices(self.params)
-        h_0_m = self.block_diag(t_m.e_me, t_m.e_mo)
-        h_2_m = self.block_diag(t_m.t_2_me, t_m.t_2_mo)
-        h_5_m = self.block_diag(t_m.t_5_me, t_m.t_5_mo)
-        h_6_m = self.block_diag(t_m.t_6_me, t_m.t_6_mo)
-        keys = ["h_0_m", "h_2_m", "h_5_m", "h_6_m", "a", "lamb_m"]
-        values = [h_0_m, h_2_m, h_5_m, h_6_m, self.params["a"], self.params["lamb_m"]]
-        self.lattice_params.set_params(dict([(key, value) for key, value in zip(keys, values)]))
+        params = self.params
+        t_m = TmdMatrices(params)
+        h_0_m, h_2_m, h_5_m, h_6_m = t_m.m_blocks
+        self.lattice_params.set_params({
+            "h_0_m": h_0_m, "h_2_m": h_2_m, "h_5_m": h_5_m, "h_6_m": h_6_m,
+            "a": params["a"], "lamb_m": params["lamb_m"]
+        })
 
 
 class TmdNN123456MeoXeo(AbstractLattice):
@@ -183,23 +170,17 @@ class TmdNN123456MeoXeo(AbstractLattice):
         )
         super().__init__(orbital=orbital, params=all["MoS2"], lattice_name="11 bands 6NN model",
                          n_v=6, n_b=11)
-        [setattr(self, var, kwargs[var]) for var in [*kwargs]]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def _generate_matrices(self):
-        t_m = TmdMatrices(self.params)
-        h_0_m = self.block_diag(t_m.e_me, t_m.e_mo)
-        h_0_x = self.block_diag(t_m.e_xe, t_m.e_xo)
-        h_1_m = self.block_diag(t_m.t_1_me, t_m.t_1_mo)
-        h_2_m = self.block_diag(t_m.t_2_me, t_m.t_2_mo)
-        h_2_x = self.block_diag(t_m.t_2_xe, t_m.t_2_xo)
-        h_3_m = self.block_diag(t_m.t_3_me, t_m.t_3_mo)
-        h_4_m = self.block_diag(t_m.t_4_me, t_m.t_4_mo)
-        h_5_m = self.block_diag(t_m.t_5_me, t_m.t_5_mo)
-        h_5_x = self.block_diag(t_m.t_5_xe, t_m.t_5_xo)
-        h_6_m = self.block_diag(t_m.t_6_me, t_m.t_6_mo)
-        h_6_x = self.block_diag(t_m.t_6_xe, t_m.t_6_xo)
-        keys = ["h_0_m", "h_0_c", "h_1_m", "h_2_m", "h_2_c", "h_3_m", "h_4_m", "h_5_m", "h_5_c", "h_6_m", "h_6_c",
-                "a", "lamb_m", "lamb_c"]
-        values = [h_0_m, h_0_x, h_1_m, h_2_m, h_2_x, h_3_m, h_4_m, h_5_m, h_5_x, h_6_m, h_6_x,
-                  self.params["a"], self.params["lamb_m"], self.params["lamb_x"]]
-        self.lattice_params.set_params(dict([(key, value) for key, value in zip(keys, values)]))
+        params = self.params
+        t_m = TmdMatrices(params)
+        h_0_m, h_2_m, h_5_m, h_6_m = t_m.m_blocks
+        h_0_x, h_2_x, h_5_x, h_6_x = t_m.x_blocks
+        h_1_m, h_3_m, h_4_m = t_m.mx_blocks
+        self.lattice_params.set_params({
+            "h_0_m": h_0_m, "h_0_c": h_0_x, "h_1_m": h_1_m, "h_2_m": h_2_m, "h_2_c": h_2_x, "h_3_m": h_3_m,
+            "h_4_m": h_4_m, "h_5_m": h_5_m, "h_5_c": h_5_x, "h_6_m": h_6_m, "h_6_c": h_6_x,
+            "a": params["a"], "lamb_m": params["lamb_m"], "lamb_c": params["lamb_x"]
+        })